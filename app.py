@@ -4,98 +4,17 @@ Batch-fill PDF forms using CSV templates
 """
 
 import streamlit as st
-import pandas as pd
 from io import BytesIO
-from typing import Dict, List
-from PIL import Image
 
 # Import modules
 from config.settings import AppConfig, PDFConfig, ExportConfig
-from src.models.form_template import FormTemplate
 from src.core.pdf_processor import PDFProcessor
-from src.core.coordinate_utils import CoordinateUtils
+from src.core.pdf_generator import PDFGenerator
 from src.io.template_loader import TemplateLoader
 from src.io.spreadsheet_processor import SpreadsheetProcessor
 from src.utils.text_utils import TextUtils
 from src.utils.file_utils import FileUtils
 
-# ReportLab imports
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.utils import ImageReader
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-
-# ============================================================================
-# PDF GENERATION
-# ============================================================================
-
-class PDFGenerator:
-    """Generate filled PDFs"""
-    
-    @staticmethod
-    def create_filled_pdf(pdf_images: List[Image.Image],
-                         template: FormTemplate,
-                         field_data: Dict[str, any]) -> BytesIO:
-        """Create PDF with overlaid data"""
-        if not REPORTLAB_AVAILABLE:
-            raise ImportError("ReportLab required")
-        
-        pdf_buffer = BytesIO()
-        c = canvas.Canvas(pdf_buffer, pagesize=letter)
-        page_width, page_height = letter
-        
-        for page_idx, page_img in enumerate(pdf_images):
-            # Draw background image
-            img_reader = ImageReader(page_img)
-            img_width, img_height = page_img.size
-            
-            scale = min(page_width / img_width, page_height / img_height)
-            scaled_width = img_width * scale
-            scaled_height = img_height * scale
-            
-            x_offset = (page_width - scaled_width) / 2
-            y_offset = (page_height - scaled_height) / 2
-            
-            c.drawImage(img_reader, x_offset, y_offset,
-                       width=scaled_width, height=scaled_height)
-            
-            # Overlay field data
-            page_fields = template.get_fields_by_page(page_idx)
-            
-            for field in page_fields:
-                if field.field_name in field_data:
-                    value = field_data[field.field_name]
-                    formatted = TextUtils.format_value(value, field.field_type.value)
-                    
-                    if formatted:
-                        if field.max_width:
-                            formatted = TextUtils.truncate_to_width(
-                                formatted, field.max_width, field.font_size
-                            )
-                        
-                        pdf_x, pdf_y = CoordinateUtils.image_to_pdf(
-                            field.x, field.y, img_height, page_height
-                        )
-                        
-                        # pdf_x = pdf_x * scale + x_offset
-                        # pdf_y = pdf_y * scale + y_offset
-                        pdf_x = pdf_x + x_offset
-                        pdf_y = pdf_y + y_offset
-                        
-                        c.setFont(field.font_name, field.font_size)
-                        c.setFillColorRGB(0, 0, 0)
-                        c.drawString(pdf_x, pdf_y, formatted)
-            
-            c.showPage()
-        
-        c.save()
-        pdf_buffer.seek(0)
-        return pdf_buffer
-
 
 # ============================================================================
 # SESSION STATE
@@ -115,6 +34,40 @@ def init_session_state():
             st.session_state[key] = value
 
 
+# ============================================================================
+# CACHED LOADERS
+# ============================================================================
+
+# Streamlit re-runs the whole script on every widget interaction, so uploads
+# are parsed once per unique file content and served from cache afterwards.
+# Entries are capped and expire so a long-running server does not keep
+# every upload's page images in memory.
+
+@st.cache_data(show_spinner=False, max_entries=AppConfig.CACHE_MAX_ENTRIES,
+               ttl=AppConfig.CACHE_TTL)
+def load_template(template_bytes: bytes):
+    """Load template from uploaded CSV bytes"""
+    return TemplateLoader.from_csv(BytesIO(template_bytes))
+
+
+@st.cache_data(show_spinner=False, max_entries=AppConfig.CACHE_MAX_ENTRIES,
+               ttl=AppConfig.CACHE_TTL)
+def load_pdf_images(pdf_bytes: bytes, grayscale: bool = False):
+    """Convert uploaded PDF bytes to page images"""
+    processor = PDFProcessor(dpi=PDFConfig.DPI, grayscale=grayscale)
+    return processor.pdf_to_images(pdf_bytes)
+
+
+@st.cache_data(show_spinner=False, max_entries=AppConfig.CACHE_MAX_ENTRIES,
+               ttl=AppConfig.CACHE_TTL)
+def load_spreadsheet(file_name: str, file_bytes: bytes):
+    """Load and process uploaded spreadsheet bytes"""
+    data_file = BytesIO(file_bytes)
+    data_file.name = file_name
+    df = SpreadsheetProcessor.load_file(data_file)
+    return SpreadsheetProcessor.process_file(df)
+
+
 # ============================================================================
 # UI COMPONENTS
 # ============================================================================
@@ -140,7 +93,7 @@ def render_upload_section():
         
         if template_file:
             try:
-                template = TemplateLoader.from_csv(template_file)
+                template = load_template(template_file.getvalue())
                 st.session_state.template = template
                 st.success(f"✓ Loaded {len(template.fields)} fields")
                 
@@ -153,11 +106,16 @@ def render_upload_section():
     with col2:
         st.subheader("📄 PDF Form")
         pdf_file = st.file_uploader("Upload PDF", type=['pdf'], key='pdf')
+        grayscale = st.checkbox(
+            "Grayscale background",
+            value=PDFConfig.GRAYSCALE,
+            help="Smaller output for black-and-white forms",
+            key='pdf_grayscale'
+        )
         
         if pdf_file:
             try:
-                processor = PDFProcessor(dpi=PDFConfig.DPI)
-                images = processor.pdf_to_images(pdf_file.read())
+                images = load_pdf_images(pdf_file.getvalue(), grayscale)
                 st.session_state.pdf_images = images
                 st.success(f"✓ Loaded {len(images)} pages")
             except Exception as e:
@@ -169,8 +127,7 @@ def render_upload_section():
         
         if data_file:
             try:
-                df = SpreadsheetProcessor.load_file(data_file)
-                df = SpreadsheetProcessor.process_file(df)
+                df = load_spreadsheet(data_file.name, data_file.getvalue())
                 st.session_state.spreadsheet_data = df
                 st.success(f"✓ Loaded {len(df)} rows")
                 
@@ -223,7 +180,7 @@ def render_mapping_section():
         
         with col2:
             current = mapping.get(column, "")
-            options = [""] + field_names
+            options = ["", *field_names]
             
             try:
                 idx = options.index(current) if current in field_names else 0
@@ -279,30 +236,41 @@ def generate_pdfs(template, images, df, mapping):
     """Generate all PDFs"""
     with st.spinner("Generating PDFs..."):
         progress = st.progress(0)
-        pdf_files = []
-        filenames = []
         
-        for idx, row in df.iterrows():
-            field_data = {}
-            for col, field_name in mapping.items():
-                if pd.notna(row[col]):
-                    field_data[field_name] = row[col]
-            
-            pdf = PDFGenerator.create_filled_pdf(images, template, field_data)
-            
-            name = df[ExportConfig.PDF_FILENAME_COL].iloc[idx]
-            filename = f"{str(name)}.pdf"
-            
-            pdf_files.append(pdf)
-            filenames.append(filename)
-            progress.progress((idx + 1) / len(df))
+        # Convert only the mapped columns to plain dicts in one pass
+        columns = [col for col in mapping if col in df.columns]
+        rows = [
+            {mapping[col]: value for col, value in record.items() if not TextUtils.is_missing(value)}
+            for record in df[columns].to_dict('records')
+        ]
+        
+        filenames = [f"{str(name)}.pdf" for name in df[ExportConfig.PDF_FILENAME_COL].tolist()]
+
+        first_pdf = None
+        
+        def pdf_entries():
+            """Yield (filename, pdf) pairs as rows finish rendering"""
+            nonlocal first_pdf
+            # Large batches render in parallel; results arrive in row order
+            pdfs = PDFGenerator.create_filled_pdfs(
+                images, template, rows,
+                max_workers=ExportConfig.MAX_WORKERS,
+                jpeg_quality=PDFConfig.JPEG_QUALITY,
+                min_parallel_rows=ExportConfig.MIN_PARALLEL_ROWS
+            )
+            for idx, pdf in enumerate(pdfs):
+                if idx == 0:
+                    first_pdf = pdf
+                progress.progress((idx + 1) / len(df))
+                yield filenames[idx], pdf
+        
+        zip_file = FileUtils.create_zip(pdf_entries())
         
-        st.success(f"✅ Generated {len(pdf_files)} PDFs!")
+        st.success(f"✅ Generated {len(filenames)} PDFs!")
         
         col1, col2 = st.columns(2)
         
         with col1:
-            zip_file = FileUtils.create_zip(pdf_files, filenames)
             st.download_button(
                 "📦 Download All as ZIP",
                 zip_file,
@@ -314,7 +282,7 @@ def generate_pdfs(template, images, df, mapping):
         with col2:
             st.download_button(
                 "📄 Download First PDF",
-                pdf_files[0],
+                first_pdf,
                 filenames[0],
                 "application/pdf",
                 use_container_width=True
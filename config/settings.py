@@ -21,12 +21,19 @@ class AppConfig:
     PAGE_TITLE = "PDF Form Filler"
     PAGE_ICON = "📝"
     LAYOUT = "wide"
+    # Bounds for the upload caches; each cached PDF holds all its page images
+    CACHE_MAX_ENTRIES = 4
+    CACHE_TTL = 3600  # seconds
 
 
 class PDFConfig:
     """PDF processing configuration"""
     DPI = 200
     DEFAULT_ZOOM = DPI / 72
+    GRAYSCALE = False  # Render page backgrounds in grayscale by default
+    # JPEG quality for page backgrounds in generated PDFs; None keeps them lossless.
+    # JPEG is smaller for scanned forms, lossless is smaller for clean digital forms.
+    JPEG_QUALITY = None
 
 
 from src.models.field_definition import FieldType
@@ -41,4 +48,6 @@ class FieldConfig:
 class ExportConfig:
     """Export configuration"""
     PDF_FILENAME_COL = "Name Of Employer As Registered 1"
-    ZIP_FILENAME = "filled_tax_forms.zip"
\ No newline at end of file
+    ZIP_FILENAME = "filled_tax_forms.zip"
+    MAX_WORKERS = None  # None uses os.cpu_count()
+    MIN_PARALLEL_ROWS = 500  # Smaller batches render in-process
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""PDF Generation Module"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from PIL import Image
+
+from src.models.form_template import FormTemplate
+from src.utils.text_utils import TextUtils
+
+try:
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import ImageReader
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+try:
+    from pypdf import PdfReader, PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+
+# Per-process state, populated once by _init_worker
+_worker_base_pdf: bytes = b""
+_worker_page_sizes: List[Tuple[int, int]] = []
+_worker_template: Optional[FormTemplate] = None
+
+
+def _init_worker(base_pdf: bytes,
+                 page_sizes: List[Tuple[int, int]],
+                 template: FormTemplate) -> None:
+    """Store the shared render inputs once per worker process"""
+    global _worker_base_pdf, _worker_page_sizes, _worker_template
+    _worker_base_pdf = base_pdf
+    _worker_page_sizes = page_sizes
+    _worker_template = template
+
+
+def _render_one(field_data: Dict[str, Any]) -> bytes:
+    """Render a single filled PDF inside a worker process"""
+    pdf = PDFGenerator.create_filled_pdf(
+        _worker_base_pdf, _worker_page_sizes, _worker_template, field_data
+    )
+    return pdf.getvalue()
+
+
+class PDFGenerator:
+    """Generate filled PDFs"""
+
+    @staticmethod
+    def _page_layout(img_width: int, img_height: int) -> Tuple[float, float, float, float]:
+        """Return (x_offset, y_offset, width, height) of an image fitted to the page"""
+        page_width, page_height = letter
+
+        scale = min(page_width / img_width, page_height / img_height)
+        scaled_width = img_width * scale
+        scaled_height = img_height * scale
+
+        x_offset = (page_width - scaled_width) / 2
+        y_offset = (page_height - scaled_height) / 2
+        return x_offset, y_offset, scaled_width, scaled_height
+
+    @staticmethod
+    def create_base_pdf(pdf_images: List[Image.Image],
+                        jpeg_quality: Optional[int] = None) -> bytes:
+        """
+        Create PDF containing only the background page images
+        With jpeg_quality set, pages are JPEG-encoded once and embedded as-is;
+        otherwise ReportLab stores them losslessly (Flate)
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("ReportLab required")
+
+        pdf_buffer = BytesIO()
+        c = canvas.Canvas(pdf_buffer, pagesize=letter)
+
+        for page_img in pdf_images:
+            if jpeg_quality:
+                image_source = BytesIO()
+                page_img.save(image_source, format='JPEG', quality=jpeg_quality)
+                image_source.seek(0)
+            else:
+                image_source = page_img
+
+            x_offset, y_offset, width, height = PDFGenerator._page_layout(*page_img.size)
+            c.drawImage(ImageReader(image_source), x_offset, y_offset,
+                       width=width, height=height)
+            c.showPage()
+
+        c.save()
+        return pdf_buffer.getvalue()
+
+    @staticmethod
+    def create_overlay_pdf(page_sizes: List[Tuple[int, int]],
+                           template: FormTemplate,
+                           field_data: Dict[str, any]) -> BytesIO:
+        """Create text-only PDF with field data for each page"""
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("ReportLab required")
+
+        pdf_buffer = BytesIO()
+        c = canvas.Canvas(pdf_buffer, pagesize=letter)
+        page_width, page_height = letter
+
+        for page_idx, (img_width, img_height) in enumerate(page_sizes):
+            x_offset, y_offset, _, _ = PDFGenerator._page_layout(img_width, img_height)
+
+            # Image pixels -> PDF points; the image origin is top-left, so y is flipped
+            coord_scale = page_height / img_height
+
+            # All fields on a page share one text object (a single BT/ET block);
+            # fonts are only switched on change
+            text = c.beginText()
+            text.setFillColorRGB(0, 0, 0)
+            current_font = None
+
+            for field in template.fields_by_page_sorted.get(page_idx, ()):
+                if field.field_name in field_data:
+                    value = field_data[field.field_name]
+                    formatted = field.formatter(value)
+
+                    if formatted:
+                        if field.max_chars is not None:
+                            formatted = TextUtils.truncate_to_chars(formatted, field.max_chars)
+
+                        pdf_x = field.x * coord_scale + x_offset
+                        pdf_y = page_height - field.y * coord_scale + y_offset
+
+                        font = (field.font_name, field.font_size)
+                        if font != current_font:
+                            text.setFont(*font)
+                            current_font = font
+                        text.setTextOrigin(pdf_x, pdf_y)
+                        text.textOut(formatted)
+
+            c.drawText(text)
+            c.showPage()
+
+        c.save()
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    @staticmethod
+    def create_filled_pdf(base_pdf: bytes,
+                          page_sizes: List[Tuple[int, int]],
+                          template: FormTemplate,
+                          field_data: Dict[str, any]) -> BytesIO:
+        """Create PDF by stamping field data onto the background PDF"""
+        if not PYPDF_AVAILABLE:
+            raise ImportError("pypdf required. Install: pip install pypdf")
+
+        overlay = PdfReader(PDFGenerator.create_overlay_pdf(page_sizes, template, field_data))
+        writer = PdfWriter(clone_from=BytesIO(base_pdf))
+
+        for page, overlay_page in zip(writer.pages, overlay.pages):
+            page.merge_page(overlay_page)
+
+        pdf_buffer = BytesIO()
+        writer.write(pdf_buffer)
+        pdf_buffer.seek(0)
+        return pdf_buffer
+
+    @staticmethod
+    def create_filled_pdfs(pdf_images: List[Image.Image],
+                           template: FormTemplate,
+                           rows: List[Dict[str, Any]],
+                           max_workers: Optional[int] = None,
+                           jpeg_quality: Optional[int] = None,
+                           min_parallel_rows: int = 500) -> Iterator[BytesIO]:
+        """
+        Create one filled PDF per row, using a process pool for large batches
+        Below min_parallel_rows, worker start-up (a fresh interpreter importing
+        ReportLab and pypdf) costs more than rendering the rows in-process.
+        PDFs are yielded in row order as they become available
+        """
+        if not REPORTLAB_AVAILABLE:
+            raise ImportError("ReportLab required")
+
+        if not rows:
+            return
+
+        workers = min(max_workers or os.cpu_count() or 1, len(rows))
+        chunksize = max(1, len(rows) // (4 * workers))
+
+        # Backgrounds are encoded once; each row only draws and merges text
+        base_pdf = PDFGenerator.create_base_pdf(pdf_images, jpeg_quality)
+        page_sizes = [img.size for img in pdf_images]
+
+        if workers == 1 or len(rows) < min_parallel_rows:
+            for field_data in rows:
+                yield PDFGenerator.create_filled_pdf(base_pdf, page_sizes, template, field_data)
+            return
+
+        # Forking the multi-threaded Streamlit server is unsafe; start clean workers instead
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context(start_method),
+                                 initializer=_init_worker,
+                                 initargs=(base_pdf, page_sizes, template)) as executor:
+            for pdf_bytes in executor.map(_render_one, rows, chunksize=chunksize):
+                yield BytesIO(pdf_bytes)
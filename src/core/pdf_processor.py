@@ -13,29 +13,35 @@ except ImportError:
 
 class PDFProcessor:
     """PDF to image conversion"""
-    
-    def __init__(self, dpi: int = 200):
+
+    def __init__(self, dpi: int = 200, grayscale: bool = False):
         self.dpi = dpi
         self.zoom = dpi / 72
-        
+        # Grayscale pages use 1 byte per pixel instead of 3
+        self.grayscale = grayscale
+
         if not PYMUPDF_AVAILABLE:
             raise ImportError("PyMuPDF required. Install: pip install PyMuPDF")
-    
+
     def pdf_to_images(self, pdf_bytes: bytes) -> List[Image.Image]:
         """Convert PDF to list of PIL Images"""
         try:
             images = []
             pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
             mat = fitz.Matrix(self.zoom, self.zoom)
+            colorspace = fitz.csGRAY if self.grayscale else fitz.csRGB
+            mode = "L" if self.grayscale else "RGB"
             
             for page_num in range(pdf_document.page_count):
                 page = pdf_document[page_num]
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("ppm")
-                img = Image.frombytes("RGB", [pix.width, pix.height], img_data)
+                pix = page.get_pixmap(matrix=mat, colorspace=colorspace)
+                # Wrap the raw samples directly instead of a PPM encode/decode round-trip
+                img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples,
+                                       "raw", mode, pix.stride, 1)
+                pix = None
                 images.append(img)
             
             pdf_document.close()
             return images
         except Exception as e:
-            raise ValueError(f"Failed to convert PDF: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Failed to convert PDF: {str(e)}")
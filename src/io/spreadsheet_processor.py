@@ -1,7 +1,86 @@
 """Spreadsheet Processing Module"""
 
+import re
 import pandas as pd
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+
+
+MALAYSIA_STATES = [
+    "JOHOR",
+    "KEDAH",
+    "KELANTAN",
+    "MELAKA",
+    "NEGERI SEMBILAN",
+    "PAHANG",
+    "PULAU PINANG",
+    "PERAK",
+    "PERLIS",
+    "SABAH",
+    "SARAWAK",
+    "SELANGOR",
+    "TERENGGANU",
+    "WILAYAH PERSEKUTUAN KUALA LUMPUR",
+    "WILAYAH PERSEKUTUAN PUTRAJAYA",
+    "WILAYAH PERSEKUTUAN LABUAN"
+]
+
+# Identifier-like columns are kept as text so leading zeros survive
+# (e.g. telephone numbers); for CSV this also skips type inference on them
+_STRING_COLUMNS = {
+    'Name Of Employer As Registered',
+    'Name Of Employee As Registered',
+    "Employer's TIN",
+    'Tax Identification No (TIN)',
+    'Correspondence address',
+    'Telephone no.',
+    'e-Mail',
+}
+
+
+def _string_columns(columns) -> List[str]:
+    """Raw headers that match _STRING_COLUMNS once stripped (process_file strips them later)"""
+    return [column for column in columns
+            if isinstance(column, str) and column.strip() in _STRING_COLUMNS]
+
+
+def _read_csv(file) -> pd.DataFrame:
+    """Read a CSV with _STRING_COLUMNS parsed as 'string'; the header row is read first"""
+    header = pd.read_csv(file, nrows=0).columns
+    file.seek(0)
+    dtype = {column: 'string' for column in _string_columns(header)}
+    return pd.read_csv(file, dtype=dtype, engine='c')
+
+
+def _cast_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast _STRING_COLUMNS of an already-typed frame (Excel) to 'string'"""
+    for column in _string_columns(df.columns):
+        values = df[column]
+        # Numeric identifiers with blank cells load as float; drop the '.0'
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype('Int64')
+        df[column] = values.astype('string')
+    return df
+
+
+# Patterns are compiled once at import and reused for every file processed
+_DIGITS = re.compile(r'(\d+)')
+_UPPER = re.compile(r'([A-Z]+)')
+_POSTCODE = re.compile(r'(\b\d{5}\b)')
+_PRE_POSTCODE = re.compile(r'^(.*?)(?=\b\d{5}\b)')
+_STATES = re.compile('(' + '|'.join(map(re.escape, MALAYSIA_STATES)) + ')')
+
+
+@lru_cache(maxsize=None)
+def _chunk_pattern(separator: str, max_len: int) -> re.Pattern:
+    """
+    Match the longest run of whole separator-delimited pieces up to max_len
+    characters, starting at the beginning or right after a separator.
+    Chunks never start on a separator, so leading and repeated separators
+    between chunks are dropped. A single piece longer than max_len is kept whole.
+    """
+    sep = re.escape(separator)
+    return re.compile(rf'(?:^|(?<={sep}))(?!{sep})(?:.{{1,{max_len}}}(?={sep}|$)|(?:(?!{sep}).)+)', re.DOTALL)
 
 
 class SpreadsheetProcessor:
@@ -12,68 +91,51 @@ class SpreadsheetProcessor:
         """Load spreadsheet from file"""
         try:
             if file.name.endswith('.csv'):
-                return pd.read_csv(file)
-            else:
-                return pd.read_excel(file)
+                return _read_csv(file)
+            try:
+                df = pd.read_excel(file, engine='calamine')
+            except (ImportError, ValueError):
+                # python-calamine missing (or pandas < 2.2): use the default engine
+                file.seek(0)
+                df = pd.read_excel(file)
+            return _cast_string_columns(df)
         except Exception as e:
             raise ValueError(f"Error loading spreadsheet: {str(e)}")
     
     @staticmethod
     def split_string(text, separator=' ', max_len=50) -> list[str]:
-        words = text.split(separator)
-        parts = []
-        current = ""
-
-        for word in words:
-            # If adding this word exceeds limit, push current and start new chunk
-            if len(current) + len(word) + (1 if current else 0) > max_len:
-                parts.append(current)
-                current = word
-            else:
-                current = word if not current else current + " " + word
-
-        # Append last part if non-empty
-        if current:
-            parts.append(current)
-
+        """Split text on separator into chunks of at most max_len characters, joined by spaces"""
+        parts = _chunk_pattern(separator, max_len).findall(text)
+        if separator != ' ':
+            parts = [part.replace(separator, ' ') for part in parts]
         return parts
     
-    # Extract state from the 'Correspondence address' column using malaysia_states list
     @staticmethod
-    def extract_state(address) -> Optional[str]:
-
-        malaysia_states = [
-            "JOHOR",
-            "KEDAH",
-            "KELANTAN",
-            "MELAKA",
-            "NEGERI SEMBILAN",
-            "PAHANG",
-            "PULAU PINANG",
-            "PERAK",
-            "PERLIS",
-            "SABAH",
-            "SARAWAK",
-            "SELANGOR",
-            "TERENGGANU",
-            "WILAYAH PERSEKUTUAN KUALA LUMPUR",
-            "WILAYAH PERSEKUTUAN PUTRAJAYA",
-            "WILAYAH PERSEKUTUAN LABUAN"
-        ]
-
-        for state in malaysia_states:
-            if state in address:
-                return state
-        return None
+    def split_series(series: pd.Series, separator=' ', max_len=50, parts=3) -> List[pd.Series]:
+        """Vectorized split_string over a Series, unpacked into `parts` columns"""
+        chunks = series.str.findall(_chunk_pattern(separator, max_len))
+        columns = []
+        for i in range(parts):
+            column = chunks.str[i].fillna('')
+            if separator != ' ':
+                column = column.str.replace(separator, ' ', regex=False)
+            columns.append(column)
+        return columns
+    
+    @staticmethod
+    def extract_states(addresses: pd.Series) -> pd.Series:
+        """
+        Extract the Malaysian state named in each address
+        The state comes after the street and city, so the last match wins
+        (street names such as JALAN KEDAH often reuse state names)
+        """
+        # Cast back so misses use the column's own missing value (NaN or <NA>)
+        return addresses.str.findall(_STATES).str[-1].astype(addresses.dtype)
     
     @staticmethod
     # Extract city by removing address_line_1, postcode, and state from 'Correspondence address'
-    def extract_city(row) -> Optional[str]:
-        address = row['Correspondence address']
-        address_line = row['address_line']
-        postcode = row['postcode']
-        state = row['state']
-        if address_line and postcode and state:
+    def extract_city(address, address_line, postcode, state) -> Optional[str]:
+        if all(isinstance(part, str) and part for part in (address_line, postcode, state)):
             return address.replace(address_line, '').replace(postcode, '').replace(state, '').strip()
         return None
     
@@ -127,22 +189,22 @@ class SpreadsheetProcessor:
         # Convert first column to uppercase
         df.loc[:, 'Name Of Employer As Registered'] = df.loc[:, 'Name Of Employer As Registered'].str.upper()
 
-        # Split employer name if exceeds 50 characters
-        df.loc[:, 'employer_name_split'] = df.loc[:, 'Name Of Employer As Registered'].str.upper().apply(lambda x: SpreadsheetProcessor.split_string(x, max_len=52))
+        # Split employer name if exceeds 52 characters
+        name_1, name_2, name_3 = SpreadsheetProcessor.split_series(df['Name Of Employer As Registered'], max_len=52)
 
         # Create new columns for split employer names
-        df.loc[:, 'Name Of Employer As Registered 1'] = df['employer_name_split'].apply(lambda x: x[0])
-        df.loc[:, 'Name Of Employer As Registered 2'] = df['employer_name_split'].apply(lambda x: x[1] if len(x) > 1 else '')
-        df.loc[:, 'Name Of Employer As Registered 3'] = df['employer_name_split'].apply(lambda x: x[2] if len(x) > 2 else '')
+        df.loc[:, 'Name Of Employer As Registered 1'] = name_1
+        df.loc[:, 'Name Of Employer As Registered 2'] = name_2
+        df.loc[:, 'Name Of Employer As Registered 3'] = name_3
 
         # Extract only digits from the 'Employer's TIN' column
-        df.loc[:, "Employer's TIN"] = df.loc[:, "Employer's TIN"].str.extract('(\d+)', expand=False)
+        df.loc[:, "Employer's TIN"] = df.loc[:, "Employer's TIN"].str.extract(_DIGITS, expand=False)
 
         # Extract TIN code from the 'Tax Identification No (TIN)' column (letters only)
-        df.loc[:, "TIN Code"] = df.loc[:, "Tax Identification No (TIN)"].str.extract('([A-Z]+)', expand=False)
+        df.loc[:, "TIN Code"] = df.loc[:, "Tax Identification No (TIN)"].str.extract(_UPPER, expand=False)
         
         # Extract TIN number from the 'Tax Identification No (TIN)' column (digits only)
-        df.loc[:, "TIN Number"] = df.loc[:, "Tax Identification No (TIN)"].str.extract('(\d+)', expand=False)
+        df.loc[:, "TIN Number"] = df.loc[:, "Tax Identification No (TIN)"].str.extract(_DIGITS, expand=False)
 
         df['Category Of Employer'] = df['Category Of Employer'].replace(employer_category_map)
         df['Employer Status'] = df['Employer Status'].replace(employer_status_map)
@@ -152,27 +214,30 @@ class SpreadsheetProcessor:
         df['country'] = 'MALAYSIA'
 
         # Extract 5-digit postcode
-        df['postcode'] = df['Correspondence address'].str.extract(r'(\b\d{5}\b)', expand=False)
+        df['postcode'] = df['Correspondence address'].str.extract(_POSTCODE, expand=False)
 
         # Extract address line 1 before the 5-digit postcode
-        df['address_line'] = df['Correspondence address'].str.extract(r'^(.*?)(?=\b\d{5}\b)', expand=False).str.strip()
+        df['address_line'] = df['Correspondence address'].str.extract(_PRE_POSTCODE, expand=False).str.strip()
 
         # Split correspondence address if exceeds 62 characters
-        df.loc[:, 'address_line_split'] = df.loc[:, 'address_line'].str.upper().apply(lambda x: SpreadsheetProcessor.split_string(x, separator=',', max_len=62))
+        address_1, address_2, address_3 = SpreadsheetProcessor.split_series(df['address_line'].str.upper(), separator=',', max_len=62)
 
         # Create new columns for split correspondence addresses
-        df.loc[:, 'address_line_1'] = df['address_line_split'].apply(lambda x: x[0].replace('  ', ', '))
-        df.loc[:, 'address_line_2'] = df['address_line_split'].apply(lambda x: x[1].replace('  ', ', ') if len(x) > 1 else '')
-        df.loc[:, 'address_line_3'] = df['address_line_split'].apply(lambda x: x[2].replace('  ', ', ') if len(x) > 2 else '')
+        df.loc[:, 'address_line_1'] = address_1.str.replace('  ', ', ', regex=False)
+        df.loc[:, 'address_line_2'] = address_2.str.replace('  ', ', ', regex=False)
+        df.loc[:, 'address_line_3'] = address_3.str.replace('  ', ', ', regex=False)
 
         # Correct 'PERSEKETUAN' to 'PERSEKUTUAN' in state names
         df['Correspondence address'] = df['Correspondence address'].replace('PERSEKETUAN', 'PERSEKUTUAN', regex=True)
         
         # Extract state from the 'Correspondence address' column
-        df['state'] = df['Correspondence address'].apply(SpreadsheetProcessor.extract_state)
+        df['state'] = SpreadsheetProcessor.extract_states(df['Correspondence address'])
 
         # Extract city from the 'Correspondence address' column
-        df['city'] = df.apply(SpreadsheetProcessor.extract_city, axis=1)
+        df['city'] = [
+            SpreadsheetProcessor.extract_city(*parts)
+            for parts in zip(df['Correspondence address'], df['address_line'], df['postcode'], df['state'])
+        ]
 
         # Abbreviate 'WILAYAH PERSEKUTUAN' to 'WP'
         df['state'] = df['state'].str.replace('WILAYAH PERSEKUTUAN', 'WP')
@@ -21,19 +21,27 @@ class TemplateLoader:
             if missing:
                 raise ValueError(f"Missing columns: {', '.join(missing)}")
             
-            fields = []
-            for _, row in df.iterrows():
-                field = FieldDefinition(
+            # Fill optional columns once rather than per row
+            defaults = {'field_type': 'text', 'font_size': 9, 'font_name': 'Helvetica'}
+            for column, default in defaults.items():
+                if column not in df.columns:
+                    df[column] = default
+            df = df.fillna(defaults)
+            has_max_width = 'max_width' in df.columns
+            
+            fields = [
+                FieldDefinition(
                     field_name=row['field_name'],
                     page_number=int(row['page_number']),
                     x=float(row['x']),
                     y=float(row['y']),
-                    field_type=FieldType(row.get('field_type', 'text')),
-                    font_size=int(row.get('font_size', 9)),
-                    font_name=row.get('font_name', 'Helvetica'),
-                    max_width=int(row['max_width']) if pd.notna(row.get('max_width')) else None
+                    field_type=FieldType(row['field_type']),
+                    font_size=int(row['font_size']),
+                    font_name=row['font_name'],
+                    max_width=int(row['max_width']) if has_max_width and pd.notna(row['max_width']) else None
                 )
-                fields.append(field)
+                for row in df.to_dict('records')
+            ]
             
             return FormTemplate(fields=fields)
         except Exception as e:
@@ -1,9 +1,12 @@
 """Field Definition Data Model"""
 
 from dataclasses import dataclass, asdict
-from typing import Optional
+from functools import cached_property
+from typing import Any, Callable, Optional
 from enum import Enum
 
+from src.utils.text_utils import TextUtils
+
 
 class FieldType(Enum):
     """Types of form fields"""
@@ -15,7 +18,11 @@ class FieldType(Enum):
 
 @dataclass
 class FieldDefinition:
-    """Represents a field in a form template"""
+    """
+    Represents a field in a form template
+    Fields are treated as fixed after creation: formatter and max_chars
+    are cached on first use and not recomputed if attributes change
+    """
     field_name: str
     page_number: int
     x: float
@@ -25,6 +32,18 @@ class FieldDefinition:
     font_name: str = "Helvetica"
     max_width: Optional[int] = None
     
+    @cached_property
+    def formatter(self) -> Callable[[Any], str]:
+        """Value formatter for this field's type, resolved once"""
+        return TextUtils.get_formatter(self.field_type.value)
+    
+    @cached_property
+    def max_chars(self) -> Optional[int]:
+        """Character budget derived from max_width, computed once"""
+        if not self.max_width:
+            return None
+        return TextUtils.max_chars_for_width(self.max_width, self.font_size)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         data = asdict(self)
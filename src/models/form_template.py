@@ -1,7 +1,8 @@
 """Form Template Data Model"""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from functools import cached_property
+from typing import List, Dict, Any, Tuple
 from .field_definition import FieldDefinition
 
 
@@ -12,13 +13,32 @@ class FormTemplate:
     template_name: str = "template"
     metadata: Dict[str, Any] = field(default_factory=dict)
     
-    def get_fields_by_page(self, page_number: int) -> List[FieldDefinition]:
+    def __post_init__(self):
+        # Index fields once; the fields list is treated as fixed after creation
+        by_page: Dict[int, List[FieldDefinition]] = {}
+        for f in self.fields:
+            by_page.setdefault(f.page_number, []).append(f)
+        # Tuples so callers cannot mutate the index
+        self._by_page: Dict[int, Tuple[FieldDefinition, ...]] = {
+            page: tuple(page_fields) for page, page_fields in by_page.items()
+        }
+        self._field_names: Tuple[str, ...] = tuple(f.field_name for f in self.fields)
+    
+    def get_fields_by_page(self, page_number: int) -> Tuple[FieldDefinition, ...]:
         """Get all fields for a specific page"""
-        return [f for f in self.fields if f.page_number == page_number]
+        return self._by_page.get(page_number, ())
+    
+    @cached_property
+    def fields_by_page_sorted(self) -> Dict[int, Tuple[FieldDefinition, ...]]:
+        """Fields grouped by page, ordered by font so font switches are minimal"""
+        return {
+            page: tuple(sorted(page_fields, key=lambda f: (f.font_name, f.font_size)))
+            for page, page_fields in self._by_page.items()
+        }
     
-    def get_field_names(self) -> List[str]:
-        """Get list of all field names"""
-        return [f.field_name for f in self.fields]
+    def get_field_names(self) -> Tuple[str, ...]:
+        """Get all field names"""
+        return self._field_names
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -1,21 +1,26 @@
 """File Utilities"""
 
 from io import BytesIO
-from typing import List
+from typing import Iterable, Tuple
 import zipfile
 
 
 class FileUtils:
     """File operation utilities"""
-    
+
     @staticmethod
-    def create_zip(pdf_files: List[BytesIO], filenames: List[str]) -> BytesIO:
-        """Create zip file containing PDFs"""
+    def create_zip(pdf_entries: Iterable[Tuple[str, BytesIO]]) -> BytesIO:
+        """
+        Create zip file containing PDFs
+        Entries are written as they are produced, so a generator keeps
+        only one PDF in memory at a time
+        """
         zip_buffer = BytesIO()
-        
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for pdf_data, filename in zip(pdf_files, filenames):
+
+        # PDFs are already compressed; deflating them again costs CPU for no gain
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+            for filename, pdf_data in pdf_entries:
                 zip_file.writestr(filename, pdf_data.getvalue())
-        
+
         zip_buffer.seek(0)
-        return zip_buffer
\ No newline at end of file
+        return zip_buffer
@@ -1,34 +1,42 @@
 """Text Processing Utilities"""
 
 import pandas as pd
-from typing import Any
+from datetime import date
+from typing import Any, Callable
 
 
 class TextUtils:
     """Text formatting utilities"""
     
+    @staticmethod
+    def is_missing(value: Any) -> bool:
+        """Scalar missing-value check (None, NaN, NaT, pd.NA) without pd.isna dispatch"""
+        return (value is None or value is pd.NA or value is pd.NaT
+                or (isinstance(value, float) and value != value))
+    
+    @staticmethod
+    def get_formatter(field_type: str) -> Callable[[Any], str]:
+        """Get the formatter for a field type, resolved once per field"""
+        return _FORMATTERS.get(field_type, _format_text)
+    
     @staticmethod
     def format_value(value: Any, field_type: str) -> str:
         """Format value based on field type"""
-        if pd.isna(value):
-            return ""
+        return TextUtils.get_formatter(field_type)(value)
+    
+    @staticmethod
+    def max_chars_for_width(max_width: int, font_size: int) -> int:
+        """Approximate number of characters that fit in a width"""
+        avg_char_width = font_size * 0.6
+        return int(max_width / avg_char_width)
+    
+    @staticmethod
+    def truncate_to_chars(text: str, max_chars: int) -> str:
+        """Truncate text to a character budget"""
+        if len(text) <= max_chars:
+            return text
         
-        if field_type == "number":
-            try:
-                return f"{float(value):,.0f}"
-            except (ValueError, TypeError):
-                return str(value)
-        elif field_type == "date":
-            if isinstance(value, pd.Timestamp):
-                return value.strftime("%d-%m-%Y")
-            return str(value)
-        elif field_type == "checkbox":
-            return "✓" if value else ""
-        else:
-            # If pandas read a number as float (e.g., 123.0), convert to int then str
-            if isinstance(value, float) and value.is_integer():
-                return str(int(value))
-            return str(value)
+        return text[:max_chars-3] + "..."
     
     @staticmethod
     def truncate_to_width(text: str, max_width: int, font_size: int) -> str:
@@ -36,10 +44,48 @@ class TextUtils:
         if max_width is None:
             return text
         
-        avg_char_width = font_size * 0.6
-        max_chars = int(max_width / avg_char_width)
-        
-        if len(text) <= max_chars:
-            return text
-        
-        return text[:max_chars-3] + "..."
\ No newline at end of file
+        max_chars = TextUtils.max_chars_for_width(max_width, font_size)
+        return TextUtils.truncate_to_chars(text, max_chars)
+
+
+# Formatters are module-level functions so templates holding them stay picklable
+
+def _format_text(value: Any) -> str:
+    if TextUtils.is_missing(value):
+        return ""
+    # If pandas read a number as float (e.g., 123.0), convert to int then str
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _format_number(value: Any) -> str:
+    if TextUtils.is_missing(value):
+        return ""
+    try:
+        return f"{float(value):,.0f}"
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _format_date(value: Any) -> str:
+    if TextUtils.is_missing(value):
+        return ""
+    # date covers datetime and pd.Timestamp (NaT is handled above)
+    if isinstance(value, date):
+        return value.strftime("%d-%m-%Y")
+    return str(value)
+
+
+def _format_checkbox(value: Any) -> str:
+    if TextUtils.is_missing(value):
+        return ""
+    return "✓" if value else ""
+
+
+_FORMATTERS = {
+    "text": _format_text,
+    "number": _format_number,
+    "date": _format_date,
+    "checkbox": _format_checkbox,
+}
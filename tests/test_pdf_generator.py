@@ -0,0 +1,88 @@
+"""Tests for PDFGenerator"""
+
+import fitz
+import pytest
+from PIL import Image
+
+from src.core.pdf_generator import PDFGenerator
+from src.models.field_definition import FieldDefinition, FieldType
+from src.models.form_template import FormTemplate
+
+# 850x1100 px has the letter aspect ratio, so the page image fills the
+# page exactly and image -> PDF coordinates are a plain 792/1100 scale
+IMAGE_SIZE = (850, 1100)
+SCALE = 792 / 1100
+
+
+@pytest.fixture(scope="module")
+def pdf_images():
+    return [Image.new("RGB", IMAGE_SIZE, "white"), Image.new("L", IMAGE_SIZE, 255)]
+
+
+@pytest.fixture(scope="module")
+def template():
+    return FormTemplate(fields=[
+        FieldDefinition("name", 0, x=100, y=200, font_size=10, font_name="Helvetica"),
+        FieldDefinition("tin", 0, x=300, y=200, font_size=12, font_name="Courier", max_width=60),
+        FieldDefinition("employees", 0, x=100, y=400, field_type=FieldType.NUMBER,
+                        font_size=10, font_name="Helvetica"),
+        FieldDefinition("state", 1, x=50, y=1000, font_size=9, font_name="Times-Roman"),
+        FieldDefinition("unused", 1, x=500, y=500),
+    ])
+
+
+ROWS = [
+    {"name": "ACME", "tin": "ABCDEFGHIJKL", "employees": 1234.0, "state": "JOHOR"},
+    {"name": "OTHER", "tin": "C123", "state": "KEDAH"},
+]
+
+
+def extract_spans(pdf_bytes):
+    """(page, text, font, origin) for every text span, origin in top-left points"""
+    spans = []
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as document:
+        for page in document:
+            for block in page.get_text("dict")["blocks"]:
+                for line in block.get("lines", []):
+                    for span in line["spans"]:
+                        x, y = span["origin"]
+                        spans.append((page.number, span["text"], span["font"], round(x, 1), round(y, 1)))
+    return sorted(spans)
+
+
+def expected_span(page, text, font, x, y):
+    # PDF y grows upwards; extraction reports it from the top like the image
+    return (page, text, font, round(x * SCALE, 1), round(y * SCALE, 1))
+
+
+def test_create_filled_pdfs_places_formatted_fields(pdf_images, template):
+    pdfs = [pdf.getvalue() for pdf in
+            PDFGenerator.create_filled_pdfs(pdf_images, template, ROWS, max_workers=1)]
+
+    assert len(pdfs) == len(ROWS)
+    for pdf in pdfs:
+        with fitz.open(stream=pdf, filetype="pdf") as document:
+            assert document.page_count == len(pdf_images)
+
+    assert extract_spans(pdfs[0]) == sorted([
+        expected_span(0, "ACME", "Helvetica", 100, 200),
+        # max_width 60 at 12pt allows 8 characters
+        expected_span(0, "ABCDE...", "Courier", 300, 200),
+        expected_span(0, "1,234", "Helvetica", 100, 400),
+        expected_span(1, "JOHOR", "Times-Roman", 50, 1000),
+    ])
+    assert extract_spans(pdfs[1]) == sorted([
+        expected_span(0, "OTHER", "Helvetica", 100, 200),
+        expected_span(0, "C123", "Courier", 300, 200),
+        expected_span(1, "KEDAH", "Times-Roman", 50, 1000),
+    ])
+
+
+def test_create_filled_pdfs_pool_matches_in_process(pdf_images, template):
+    rows = ROWS * 3
+    serial = PDFGenerator.create_filled_pdfs(pdf_images, template, rows, max_workers=1)
+    pooled = PDFGenerator.create_filled_pdfs(pdf_images, template, rows,
+                                             max_workers=2, min_parallel_rows=1)
+
+    assert [extract_spans(pdf.getvalue()) for pdf in pooled] == \
+        [extract_spans(pdf.getvalue()) for pdf in serial]
@@ -0,0 +1,146 @@
+"""Tests for SpreadsheetProcessor"""
+
+import random
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from src.io.spreadsheet_processor import SpreadsheetProcessor
+
+
+def reference_split_string(text, separator=' ', max_len=50):
+    """The original word-by-word split_string loop"""
+    words = text.split(separator)
+    parts = []
+    current = ""
+
+    for word in words:
+        if len(current) + len(word) + (1 if current else 0) > max_len:
+            parts.append(current)
+            current = word
+        else:
+            current = word if not current else current + " " + word
+
+    if current:
+        parts.append(current)
+
+    return parts
+
+
+def named_buffer(data, name):
+    """In-memory upload with the .name attribute load_file dispatches on"""
+    buffer = BytesIO(data)
+    buffer.name = name
+    return buffer
+
+
+def random_texts(separator, max_piece_len, count=2000, seed=0):
+    """Texts with empty, leading, trailing and repeated separator-delimited pieces"""
+    rng = random.Random(seed)
+    alphabet = 'AB ()&' if separator == ',' else 'AB(),&'
+    for _ in range(count):
+        pieces = [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, max_piece_len)))
+            for _ in range(rng.randint(0, 12))
+        ]
+        yield separator.join(pieces)
+
+
+def test_extract_states_uses_last_state_in_address():
+    addresses = pd.Series(["NO 1 JALAN KEDAH, TAMAN PELANGI 80400 JOHOR BAHRU JOHOR"])
+    assert SpreadsheetProcessor.extract_states(addresses).tolist() == ["JOHOR"]
+
+
+def test_extract_states_without_state():
+    addresses = pd.Series(["NO 1 JALAN MAWAR 12345 SINGAPORE", None])
+    assert SpreadsheetProcessor.extract_states(addresses).isna().all()
+
+
+def test_extract_states_keeps_string_dtype():
+    addresses = pd.Series(["NO 1 JALAN MAWAR 12345 SINGAPORE", None, "47000 SELANGOR"], dtype='string')
+    states = SpreadsheetProcessor.extract_states(addresses)
+    assert states.dtype == 'string'
+    assert states.tolist() == [pd.NA, pd.NA, "SELANGOR"]
+
+
+def test_load_csv_types_padded_identifier_headers_as_string():
+    data = b" Telephone no. ,Employer's TIN,Count\n0123456789,E 0012,1\n"
+    df = SpreadsheetProcessor.load_file(named_buffer(data, 'data.csv'))
+    assert df[' Telephone no. '].dtype == 'string'
+    assert df[' Telephone no. '].tolist() == ['0123456789']
+    assert df["Employer's TIN"].dtype == 'string'
+    assert df['Count'].dtype == 'int64'
+
+
+def test_load_excel_types_identifier_columns_as_string():
+    pytest.importorskip('openpyxl')
+    source = pd.DataFrame({
+        'Telephone no. ': [60123456789, None],
+        'e-Mail': ['a@b.my', None],
+        'Count': [1, 2],
+    })
+    buffer = BytesIO()
+    source.to_excel(buffer, index=False)
+
+    df = SpreadsheetProcessor.load_file(named_buffer(buffer.getvalue(), 'data.xlsx'))
+    assert df['Telephone no. '].dtype == 'string'
+    # The blank cell makes the column float on read; the '.0' must not leak into the text
+    assert df['Telephone no. '].tolist() == ['60123456789', pd.NA]
+    assert df['e-Mail'].tolist() == ['a@b.my', pd.NA]
+    assert df['Count'].dtype == 'int64'
+
+
+@pytest.mark.parametrize("text, separator, max_len, expected", [
+    (" ABC SDN BHD", ' ', 52, ['ABC SDN BHD']),
+    ("A" * 48 + " SDN  BHD", ' ', 52, ["A" * 48 + " SDN", 'BHD']),
+    (",,NO 1,TAMAN", ',', 8, ['NO 1', 'TAMAN']),
+    ("", ' ', 52, []),
+])
+def test_split_string_drops_empty_pieces(text, separator, max_len, expected):
+    assert SpreadsheetProcessor.split_string(text, separator, max_len) == expected
+    assert reference_split_string(text, separator, max_len) == expected
+
+
+LONG = "ABCDEFGHIJKLMN"  # longer than max_len=10
+
+
+@pytest.mark.parametrize("text, separator, expected", [
+    (f"AB CD {LONG} EF", ' ', ['AB CD', LONG, 'EF']),
+    (f"AB CD {LONG}", ' ', ['AB CD', LONG]),
+    (f"AB CD EF {LONG} GH IJ", ' ', ['AB CD EF', LONG, 'GH IJ']),
+    (f"NO 1,{LONG},TAMAN", ',', ['NO 1', LONG, 'TAMAN']),
+    (f"NO 1,TAMAN,{LONG}", ',', ['NO 1 TAMAN', LONG]),
+])
+def test_split_string_keeps_long_piece_whole(text, separator, expected):
+    assert SpreadsheetProcessor.split_string(text, separator, max_len=10) == expected
+    assert reference_split_string(text, separator, max_len=10) == expected
+
+
+@pytest.mark.parametrize("text, separator, expected", [
+    (LONG, ' ', [LONG]),
+    (f"{LONG} AB CD", ' ', [LONG, 'AB CD']),
+    (f"{LONG},TAMAN", ',', [LONG, 'TAMAN']),
+])
+def test_split_string_long_first_piece_has_no_empty_chunk(text, separator, expected):
+    # Deliberate difference: the original loop emitted an empty first chunk here
+    assert SpreadsheetProcessor.split_string(text, separator, max_len=10) == expected
+    assert reference_split_string(text, separator, max_len=10) == [''] + expected
+
+
+@pytest.mark.parametrize("separator, max_len", [(' ', 52), (',', 62), (' ', 10), (',', 8)])
+def test_split_string_matches_reference(separator, max_len):
+    for text in random_texts(separator, min(max_len, 8)):
+        expected = reference_split_string(text, separator, max_len)
+        assert SpreadsheetProcessor.split_string(text, separator, max_len) == expected, text
+
+
+@pytest.mark.parametrize("separator, max_len", [(' ', 52), (',', 8)])
+def test_split_series_matches_reference(separator, max_len):
+    texts = list(random_texts(separator, min(max_len, 8), count=500, seed=1))
+    columns = SpreadsheetProcessor.split_series(pd.Series(texts), separator, max_len)
+
+    for i, text in enumerate(texts):
+        expected = reference_split_string(text, separator, max_len)[:3]
+        expected += [''] * (3 - len(expected))
+        assert [column[i] for column in columns] == expected, text
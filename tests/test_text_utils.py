@@ -0,0 +1,86 @@
+"""Tests for TextUtils"""
+
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.text_utils import TextUtils
+
+MISSING = [None, float('nan'), np.nan, pd.NA, pd.NaT]
+
+
+@pytest.mark.parametrize("field_type", ["text", "number", "date", "checkbox", "unknown"])
+@pytest.mark.parametrize("value", MISSING, ids=repr)
+def test_missing_values_format_as_empty(field_type, value):
+    assert TextUtils.is_missing(value)
+    assert TextUtils.format_value(value, field_type) == ""
+
+
+@pytest.mark.parametrize("value", [0, 0.0, "", "nan", False])
+def test_falsy_values_are_not_missing(value):
+    assert not TextUtils.is_missing(value)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("ACME SDN BHD", "ACME SDN BHD"),
+    (123.0, "123"),
+    (123.5, "123.5"),
+    (42, "42"),
+    ("0123", "0123"),
+])
+def test_format_text(value, expected):
+    assert TextUtils.format_value(value, "text") == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (1234567, "1,234,567"),
+    (1234.4, "1,234"),
+    ("2500", "2,500"),
+    ("N/A", "N/A"),
+    ([1], "[1]"),
+])
+def test_format_number(value, expected):
+    assert TextUtils.format_value(value, "number") == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (pd.Timestamp("2025-12-31"), "31-12-2025"),
+    (datetime(2025, 1, 2, 13, 45), "02-01-2025"),
+    (date(2025, 1, 2), "02-01-2025"),
+    (time(13, 45), "13:45:00"),
+    ("31/12/2025", "31/12/2025"),
+])
+def test_format_date(value, expected):
+    assert TextUtils.format_value(value, "date") == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, "✓"),
+    (1, "✓"),
+    ("yes", "✓"),
+    (False, ""),
+    (0, ""),
+    ("", ""),
+])
+def test_format_checkbox(value, expected):
+    assert TextUtils.format_value(value, "checkbox") == expected
+
+
+def test_unknown_field_type_formats_as_text():
+    assert TextUtils.format_value(123.0, "signature") == "123"
+
+
+def test_get_formatter_matches_format_value():
+    for field_type in ["text", "number", "date", "checkbox"]:
+        assert TextUtils.get_formatter(field_type)(1234.0) == TextUtils.format_value(1234.0, field_type)
+
+
+@pytest.mark.parametrize("text, max_chars, expected", [
+    ("SHORT", 8, "SHORT"),
+    ("EXACTLY8", 8, "EXACTLY8"),
+    ("ABCDEFGHIJKL", 8, "ABCDE..."),
+])
+def test_truncate_to_chars(text, max_chars, expected):
+    assert TextUtils.truncate_to_chars(text, max_chars) == expected